@@ -3,21 +3,272 @@ Economic Data Preprocessing Script
 File: data/scripts/data_preprocessing.py
 
 Purpose: Import, clean, and export processed economic datasets
-Libraries: Pandas, NumPy
+Libraries: Pandas, NumPy, PyArrow, Numba, NumExpr, Polars (optional)
 Input: CSV files from data/raw/
 Output: Cleaned CSV to data/processed/
 """
 
 import pandas as pd
+from pandas.tseries.api import guess_datetime_format
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet
+import numba
+import numexpr as ne
+import math
 import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 import logging
 
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Files larger than this are streamed in chunks of CHUNK_ROWS rows
+CHUNKED_READ_BYTES = 256 * 1024**2
+CHUNK_ROWS = 200_000
+
+# Strings Arrow's float parser accepts; anything else becomes NaN, like
+# pd.to_numeric(errors='coerce')
+_NUMERIC_PATTERN = r'^[+-]?((\d+\.?\d*|\.\d+)([eE][+-]?\d+)?|inf|infinity|nan)$'
+
+
+@numba.njit(parallel=True, cache=True)
+def _col_stats_and_outliers(a, k=3.0):
+    """
+    Per-column valid counts and counts of values more than k sample standard
+    deviations from the mean, for a 2-D float array. NaNs are skipped,
+    matching pandas' mean/std.
+    """
+    n, m = a.shape
+    counts = np.zeros(m, np.int64)
+    outlier_counts = np.zeros(m, np.int64)
+    
+    for j in numba.prange(m):
+        s = 0.0
+        c = 0
+        for i in range(n):
+            v = a[i, j]
+            if not np.isnan(v):
+                s += v
+                c += 1
+        counts[j] = c
+        if c < 2:
+            continue
+        
+        # Squared deviations from the mean, not sum(v * v) - c * mu * mu,
+        # which cancels when the mean is large relative to the spread
+        mu = s / c
+        ss = 0.0
+        for i in range(n):
+            v = a[i, j]
+            if not np.isnan(v):
+                ss += (v - mu) * (v - mu)
+        sd = math.sqrt(ss / (c - 1))
+        
+        cnt = 0
+        for i in range(n):
+            v = a[i, j]
+            if not np.isnan(v) and abs(v - mu) > k * sd:
+                cnt += 1
+        outlier_counts[j] = cnt
+    
+    return counts, outlier_counts
+
+
+@numba.njit(parallel=True, cache=True)
+def _linear_interp_2d(a):
+    """
+    Fill NaN runs in each column of a 2-D float array in place by linear
+    interpolation between the surrounding valid values. Trailing NaNs take
+    the last valid value and leading NaNs are left untouched, matching
+    pandas' interpolate(method='linear').
+    """
+    n, m = a.shape
+    
+    for j in numba.prange(m):
+        li = -1
+        lv = np.nan
+        for i in range(n):
+            v = a[i, j]
+            if np.isnan(v):
+                continue
+            if li >= 0 and i - li > 1:
+                step = (v - lv) / (i - li)
+                for k in range(li + 1, i):
+                    a[k, j] = lv + step * (k - li)
+            li = i
+            lv = v
+        
+        if li >= 0:
+            for k in range(li + 1, n):
+                a[k, j] = lv
+    
+    return a
+
+
+@numba.njit(parallel=True, cache=True, error_model='numpy')
+def _fused_pipeline(a, k, gdp, infl, fd, gs, growth, fiscal_ratio, gov_ratio, price_index, real_gdp):
+    """
+    Outlier statistics, linear interpolation and derived variables for a
+    Fortran-ordered 2-D float block in a few sweeps instead of one per stage.
+    
+    Each column is scanned once for its valid count and sum, once for the
+    squared deviations from its mean, and once more to count outliers
+    (k standard deviations) while filling
+    NaN runs in place, with the same edge rules as _linear_interp_2d. A
+    final row sweep writes the derived series into the preallocated output
+    arrays from the interpolated GDP, Inflation_Rate, Fiscal_Deficit and
+    Government_Spending columns, whose indices are -1 when absent.
+    """
+    n, m = a.shape
+    counts = np.zeros(m, np.int64)
+    outlier_counts = np.zeros(m, np.int64)
+    
+    for j in numba.prange(m):
+        s = 0.0
+        c = 0
+        for i in range(n):
+            v = a[i, j]
+            if not np.isnan(v):
+                s += v
+                c += 1
+        counts[j] = c
+        if c == 0:
+            continue
+        
+        # Squared deviations from the mean, as in _col_stats_and_outliers
+        mu = s / c
+        ss = 0.0
+        for i in range(n):
+            v = a[i, j]
+            if not np.isnan(v):
+                ss += (v - mu) * (v - mu)
+        sd = math.sqrt(ss / (c - 1)) if c > 1 else np.nan
+        
+        cnt = 0
+        li = -1
+        lv = np.nan
+        for i in range(n):
+            v = a[i, j]
+            if np.isnan(v):
+                continue
+            if abs(v - mu) > k * sd:
+                cnt += 1
+            if li >= 0 and i - li > 1:
+                step = (v - lv) / (i - li)
+                for r in range(li + 1, i):
+                    a[r, j] = lv + step * (r - li)
+            li = i
+            lv = v
+        for r in range(li + 1, n):
+            a[r, j] = lv
+        outlier_counts[j] = cnt
+    
+    log_cumulative = 0.0
+    for i in range(n):
+        if gdp >= 0:
+            g = a[i, gdp]
+            if i >= 12:
+                growth[i] = (g / a[i - 12, gdp] - 1.0) * 100.0
+            if fd >= 0:
+                fiscal_ratio[i] = a[i, fd] / g * 100.0
+            if gs >= 0:
+                gov_ratio[i] = a[i, gs] / g * 100.0
+            
+            # Periods with missing inflation, or inflation at or below -100%
+            # where 1 + r is not positive, are skipped in the running product,
+            # accumulated as a sum of logs to avoid overflow on long horizons
+            if infl >= 0 and a[i, infl] > -100.0:
+                log_cumulative += math.log1p(a[i, infl] * 0.01)
+                cumulative = math.exp(log_cumulative)
+                price_index[i] = 100.0 * cumulative
+                real_gdp[i] = g / cumulative
+    
+    return counts, outlier_counts
+
+
+def _forward_fill(values):
+    """Return a copy of a 1-D float array with NaNs replaced by the last valid value."""
+    idx = np.where(np.isnan(values), -1, np.arange(len(values)))
+    np.maximum.accumulate(idx, out=idx)
+    
+    # Leading NaNs have no earlier value and stay NaN
+    return np.where(idx >= 0, values[idx], np.nan).astype(values.dtype)
+
+
+def _is_numeric_array(values):
+    """Whether a column array holds numbers (not object, string or datetime data)."""
+    return isinstance(values, np.ndarray) and np.issubdtype(values.dtype, np.number)
+
+
+def _narrow_float(values):
+    """
+    Return a float64 array as float32 when every value survives the round
+    trip exactly, otherwise return it unchanged.
+    """
+    with np.errstate(over='ignore'):
+        narrowed = values.astype(np.float32)
+    if np.array_equal(narrowed.astype(np.float64), values, equal_nan=True):
+        return narrowed
+    return values
+
+
+def _restore_dtype(values, dtype):
+    """Cast a float64 result back to a column's original dtype, keeping float64 where float32 would lose data."""
+    if dtype == np.float32:
+        return _narrow_float(values.astype(np.float64, copy=False))
+    return values.astype(dtype)
+
+
+def _promote_schema(schema, other):
+    """
+    Unify two Arrow schemas with the same columns, promoting numeric types
+    (e.g. int64 to double) and falling back to string for columns whose
+    types can't be reconciled.
+    """
+    fields = []
+    for field in schema:
+        pair = [pa.schema([field]), pa.schema([other.field(field.name)])]
+        try:
+            fields.append(pa.unify_schemas(pair, promote_options='permissive').field(0))
+        except (pa.ArrowTypeError, pa.ArrowInvalid):
+            fields.append(pa.field(field.name, pa.string()))
+    return pa.schema(fields, metadata=schema.metadata)
+
+
+def _stack_columns(cols, names):
+    """Copy the named columns into one Fortran-ordered float64 block, one column per array."""
+    n_rows = len(cols[names[0]])
+    block = np.empty((n_rows, len(names)), dtype=np.float64, order='F')
+    for j, col in enumerate(names):
+        block[:, j] = cols[col]
+    return block
+
+
+def _df_to_cols(df):
+    """
+    Unpack a DataFrame into a dict of column arrays. NumPy-typed columns
+    become ndarrays; extension types such as categoricals keep their
+    pandas array so they survive the round trip.
+    """
+    return {col: df[col].to_numpy() if isinstance(df[col].dtype, np.dtype) else df[col].array
+            for col in df.columns}
+
+
+def _cols_to_df(cols):
+    """Rebuild a DataFrame from a dict of column arrays."""
+    return pd.DataFrame(cols, copy=False)
+
+
 class EconomicDataPreprocessor:
     """
     A class to handle preprocessing of economic data including GDP, inflation,
@@ -51,8 +302,45 @@ class EconomicDataPreprocessor:
             filepath = os.path.join(self.raw_data_path, filename)
             logger.info(f"Loading data from {filepath}")
             
-            df = pd.read_csv(filepath)
+            # Reuse the Parquet copy from a previous run if the CSV is
+            # unchanged, judged by the size and mtime recorded with the copy
+            cache_path = filepath + '.parquet'
+            source = self._source_signature(filepath)
+            if os.path.exists(cache_path) and self._cached_signature(cache_path) == source:
+                df = pd.read_parquet(cache_path, engine='pyarrow')
+                logger.info(f"Successfully loaded {len(df)} rows from cached {cache_path}")
+                return df
+            
+            # Probe the head of the file to pick compact dtypes for the full read
+            probe = pd.read_csv(filepath, nrows=2000)
+            parse_dates = ['Date'] if 'Date' in probe.columns else None
+            dtypes = self._infer_dtypes(probe)
+            
+            if os.path.getsize(filepath) > CHUNKED_READ_BYTES:
+                read = self._read_csv_chunked
+            else:
+                read = self._read_csv
+            
+            try:
+                df = read(filepath, dtypes, parse_dates)
+            except ValueError as e:
+                # Unparseable entries in a numeric column; let
+                # clean_numeric_columns coerce them instead. Malformed
+                # rows are a different failure and are not retried
+                if isinstance(e, pd.errors.ParserError) or not dtypes:
+                    raise
+                logger.warning(f"Type casting failed for {filename}. Inferring column types.")
+                df = read(filepath, {}, parse_dates)
+            self._narrow_float_columns(df)
             logger.info(f"Successfully loaded {len(df)} rows from {filename}")
+            
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                table = table.replace_schema_metadata({**(table.schema.metadata or {}), **source})
+                pyarrow.parquet.write_table(table, cache_path, compression='zstd')
+            except Exception as e:
+                logger.warning(f"Could not cache {filename} as Parquet: {str(e)}")
+            
             return df
         
         except FileNotFoundError:
@@ -62,6 +350,158 @@ class EconomicDataPreprocessor:
             logger.error(f"Error loading {filename}: {str(e)}")
             return None
     
+    def _source_signature(self, filepath):
+        """Return the size and mtime of a file as Parquet schema metadata."""
+        stat = os.stat(filepath)
+        return {b'source_size': str(stat.st_size).encode(),
+                b'source_mtime_ns': str(stat.st_mtime_ns).encode()}
+    
+    def _cached_signature(self, cache_path):
+        """Return the source signature recorded in a cached Parquet file, if any."""
+        try:
+            metadata = pyarrow.parquet.read_schema(cache_path).metadata or {}
+        except Exception:
+            return None
+        return {key: metadata.get(key) for key in (b'source_size', b'source_mtime_ns')}
+    
+    def _read_csv(self, filepath, dtypes, parse_dates):
+        """
+        Read a whole CSV file with the pyarrow engine, falling back to the C
+        engine for files Arrow can't parse, such as rows with missing
+        trailing fields, which the C engine pads with NaN.
+        """
+        try:
+            return pd.read_csv(filepath, engine='pyarrow', dtype=dtypes, parse_dates=parse_dates)
+        except pd.errors.ParserError as e:
+            logger.warning(f"Arrow could not parse {filepath} ({str(e)}). Using the C engine.")
+            return pd.read_csv(filepath, dtype=dtypes, parse_dates=parse_dates)
+    
+    def _read_csv_chunked(self, filepath, dtypes, parse_dates):
+        """
+        Stream a large CSV in chunks, coercing each chunk's numeric and date
+        columns before appending it to a temporary Arrow IPC file, so the
+        raw text of the whole file is never held in memory at once.
+        """
+        # Per-chunk dictionaries can't be appended to one IPC file, so
+        # categorical columns are read as strings and converted once at the
+        # end. Pinning them keeps a chunk where one is entirely blank from
+        # being inferred as float
+        categorical = [col for col, dtype in dtypes.items() if dtype == 'category']
+        chunk_dtypes = {col: 'string' if dtype == 'category' else dtype for col, dtype in dtypes.items()}
+        numeric_columns = [col for col in self.expected_columns.keys() if col != 'Date']
+        
+        fd, tmp_path = tempfile.mkstemp(suffix='.arrow')
+        os.close(fd)
+        writer = None
+        try:
+            date_format = None
+            # Round-trip float parsing matches the pyarrow engine to the last bit
+            for chunk in pd.read_csv(filepath, chunksize=CHUNK_ROWS, dtype=chunk_dtypes,
+                                     float_precision='round_trip'):
+                if parse_dates:
+                    # Detect the format on the first chunk and reuse it
+                    if writer is None:
+                        date_format = self._detect_date_format(chunk['Date'])
+                    chunk['Date'] = pd.to_datetime(chunk['Date'], format=date_format, errors='coerce')
+                
+                non_numeric = {col: chunk[col].to_numpy() for col in numeric_columns
+                               if col in chunk.columns and not pd.api.types.is_numeric_dtype(chunk[col])}
+                for col, values in self._cast_to_float(non_numeric).items():
+                    chunk[col] = values
+                
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    schema = table.schema
+                    writer = pa.ipc.new_file(tmp_path, schema)
+                elif not table.schema.equals(schema):
+                    # Columns without a pinned dtype can still change type in
+                    # a later chunk, e.g. an integer column that turns out to
+                    # hold floats; promote the file's schema and rewrite what
+                    # was already written, one batch at a time
+                    unified = _promote_schema(schema, table.schema)
+                    if not unified.equals(schema):
+                        writer.close()
+                        writer = None
+                        schema = unified
+                        tmp_path, writer = self._recast_ipc_file(tmp_path, schema)
+                writer.write_table(table.cast(schema))
+            
+            if writer is None:
+                return pd.read_csv(filepath, nrows=0)
+            writer.close()
+            writer = None
+            
+            with pa.memory_map(tmp_path) as source:
+                df = pa.ipc.open_file(source).read_all().to_pandas()
+        finally:
+            if writer is not None:
+                writer.close()
+            os.remove(tmp_path)
+        
+        # Build the categories from plain objects, as the whole-file read does
+        for col in categorical:
+            df[col] = pd.Categorical(df[col].to_numpy(object, na_value=np.nan))
+        
+        return df
+    
+    def _recast_ipc_file(self, path, schema):
+        """
+        Copy an Arrow IPC file to a new temporary file under a wider schema,
+        one record batch at a time, and delete the original. Returns the new
+        path and a writer left open on it for further batches.
+        """
+        fd, new_path = tempfile.mkstemp(suffix='.arrow')
+        os.close(fd)
+        writer = pa.ipc.new_file(new_path, schema)
+        try:
+            with pa.memory_map(path) as source:
+                reader = pa.ipc.open_file(source)
+                for i in range(reader.num_record_batches):
+                    writer.write_batch(reader.get_batch(i).cast(schema))
+        except Exception:
+            writer.close()
+            os.remove(new_path)
+            raise
+        os.remove(path)
+        return new_path, writer
+    
+    def _infer_dtypes(self, probe):
+        """
+        Infer a dtype map from a sample of the file: numeric columns are
+        read as float64 and string columns become categorical.
+        """
+        dtypes = {}
+        for col in probe.columns:
+            if col == 'Date':
+                continue
+            
+            is_numeric = pd.api.types.is_numeric_dtype(probe[col])
+            if is_numeric and (col in self.expected_columns or pd.api.types.is_float_dtype(probe[col])):
+                dtypes[col] = 'float64'
+            elif probe[col].dtype == object and col not in self.expected_columns:
+                dtypes[col] = 'category'
+        
+        return dtypes
+    
+    def _narrow_float_columns(self, df):
+        """
+        Store float columns as float32 where every value round-trips
+        exactly, checked over the whole column rather than a sample.
+        """
+        for col in df.columns:
+            if df[col].dtype == np.float64:
+                df[col] = _narrow_float(df[col].to_numpy())
+    
+    def _detect_date_format(self, dates):
+        """
+        Return 'ISO8601' when a sample of the dates parses in that format, so
+        the vectorised ISO parser handles the whole column; otherwise None,
+        letting pandas infer the format from the first value.
+        """
+        sample = dates.dropna().iloc[:10]
+        parsed = pd.to_datetime(sample, format='ISO8601', errors='coerce')
+        return 'ISO8601' if parsed.notna().any() else None
+    
     def clean_date_column(self, df):
         """Clean and standardize the Date column."""
         logger.info("Cleaning Date column...")
@@ -70,8 +510,11 @@ class EconomicDataPreprocessor:
             logger.warning("Date column not found. Creating dummy dates.")
             df['Date'] = pd.date_range(start='2020-01-01', periods=len(df), freq='M')
         else:
-            # Convert to datetime, handling various formats
-            df['Date'] = pd.to_datetime(df['Date'], errors='coerce', infer_datetime_format=True)
+            # Convert to datetime, handling various formats (skipped when the
+            # reader already parsed the column)
+            if not pd.api.types.is_datetime64_any_dtype(df['Date']):
+                date_format = self._detect_date_format(df['Date'])
+                df['Date'] = pd.to_datetime(df['Date'], format=date_format, errors='coerce')
             
             # Remove rows with invalid dates
             invalid_dates = df['Date'].isna().sum()
@@ -79,107 +522,201 @@ class EconomicDataPreprocessor:
                 logger.warning(f"Removing {invalid_dates} rows with invalid dates")
                 df = df.dropna(subset=['Date'])
         
-        return df.sort_values('Date').reset_index(drop=True)
+        # Already-sorted input (the usual case for appended time series)
+        # only needs its index reset; otherwise gather rows in one take
+        dates = df['Date'].to_numpy('datetime64[ns]').view('i8')
+        if np.all(np.diff(dates) >= 0):
+            return df.reset_index(drop=True)
+        
+        order = np.argsort(dates, kind='stable')
+        return df.take(order).reset_index(drop=True)
     
-    def clean_numeric_columns(self, df):
-        """Clean and validate numeric columns."""
+    def clean_numeric_columns(self, cols):
+        """Clean and validate numeric columns of a dict of column arrays."""
         logger.info("Cleaning numeric columns...")
         
-        numeric_columns = [col for col in self.expected_columns.keys() if col != 'Date']
+        numeric_columns = self._coerce_numeric_columns(cols)
+        if not numeric_columns:
+            return cols
         
-        for col in numeric_columns:
-            if col in df.columns:
-                # Convert to numeric, replacing invalid values with NaN
-                df[col] = pd.to_numeric(df[col], errors='coerce')
-                
-                # Log missing values
-                missing_count = df[col].isna().sum()
-                if missing_count > 0:
-                    logger.info(f"{col}: {missing_count} missing values detected")
-                
-                # Handle outliers (values beyond 3 standard deviations)
-                if not df[col].isna().all():
-                    mean_val = df[col].mean()
-                    std_val = df[col].std()
-                    outlier_threshold = 3 * std_val
-                    
-                    outliers = np.abs(df[col] - mean_val) > outlier_threshold
-                    outlier_count = outliers.sum()
-                    
-                    if outlier_count > 0:
-                        logger.warning(f"{col}: {outlier_count} potential outliers detected")
-                        # Option to cap outliers instead of removing them
-                        # df.loc[outliers, col] = np.nan
-            else:
+        # Missing counts and outliers (values beyond 3 standard deviations)
+        # for every column in one compiled pass
+        counts, outlier_counts = _col_stats_and_outliers(_stack_columns(cols, numeric_columns), 3.0)
+        self._log_column_stats(numeric_columns, len(cols[numeric_columns[0]]), counts, outlier_counts)
+        
+        return cols
+    
+    def _coerce_numeric_columns(self, cols):
+        """
+        Convert the expected numeric columns to numbers in place, replacing
+        invalid values with NaN, and return the names of those present.
+        """
+        numeric_columns = [col for col in self.expected_columns.keys() if col != 'Date'
+                           and col in cols]
+        for col in self.expected_columns.keys():
+            if col != 'Date' and col not in cols:
                 logger.warning(f"Expected column '{col}' not found in data")
         
-        return df
+        # Columns the reader already typed are left alone; the rest are cast together
+        non_numeric = {col: cols[col] for col in numeric_columns
+                       if not _is_numeric_array(cols[col])}
+        if non_numeric:
+            cols.update(self._cast_to_float(non_numeric))
+        
+        return numeric_columns
     
-    def handle_missing_values(self, df, method='interpolate'):
-        """Handle missing values in the dataset."""
+    def _log_column_stats(self, columns, n_rows, counts, outlier_counts):
+        """Log missing-value and outlier counts per column."""
+        for col, valid_count, outlier_count in zip(columns, counts, outlier_counts):
+            missing_count = n_rows - valid_count
+            if missing_count > 0:
+                logger.info(f"{col}: {missing_count} missing values detected")
+            
+            if outlier_count > 0:
+                logger.warning(f"{col}: {outlier_count} potential outliers detected")
+                # Option to cap outliers instead of removing them
+                # cols[col][outliers] = np.nan
+    
+    def clean_interpolate_and_derive(self, cols):
+        """
+        Equivalent of clean_numeric_columns, handle_missing_values with
+        linear interpolation and add_derived_variables, run as a single
+        compiled kernel over the numeric block.
+        """
+        logger.info("Cleaning numeric columns, interpolating and adding derived variables...")
+        
+        numeric_columns = self._coerce_numeric_columns(cols)
+        
+        # Integer columns cannot hold NaN, so only float columns need filling
+        block_columns = numeric_columns + [
+            col for col, values in cols.items() if col not in numeric_columns
+            and isinstance(values, np.ndarray) and np.issubdtype(values.dtype, np.floating)]
+        if not block_columns:
+            return cols
+        
+        block = _stack_columns(cols, block_columns)
+        n_rows = block.shape[0]
+        index = {col: block_columns.index(col) if col in block_columns else -1
+                 for col in ['GDP', 'Inflation_Rate', 'Fiscal_Deficit', 'Government_Spending']}
+        outputs = {name: np.full(n_rows, np.nan) for name in
+                   ['GDP_Growth_Rate', 'Fiscal_Balance_GDP_Ratio', 'Gov_Spending_GDP_Ratio',
+                    'Price_Index', 'Real_GDP']}
+        
+        counts, outlier_counts = _fused_pipeline(
+            block, 3.0, index['GDP'], index['Inflation_Rate'], index['Fiscal_Deficit'],
+            index['Government_Spending'], *outputs.values())
+        
+        n_stats = len(numeric_columns)
+        self._log_column_stats(numeric_columns, n_rows, counts[:n_stats], outlier_counts[:n_stats])
+        
+        # Restore any float32 or integer columns the block was widened from
+        for j, col in enumerate(block_columns):
+            cols[col] = _restore_dtype(block[:, j], cols[col].dtype)
+        
+        # Keep only the derived variables whose inputs are present
+        if index['GDP'] >= 0 and n_rows > 12:
+            cols['GDP_Growth_Rate'] = outputs['GDP_Growth_Rate']
+        if index['GDP'] >= 0 and index['Fiscal_Deficit'] >= 0:
+            cols['Fiscal_Balance_GDP_Ratio'] = outputs['Fiscal_Balance_GDP_Ratio']
+        if index['GDP'] >= 0 and index['Government_Spending'] >= 0:
+            cols['Gov_Spending_GDP_Ratio'] = outputs['Gov_Spending_GDP_Ratio']
+        if index['GDP'] >= 0 and index['Inflation_Rate'] >= 0:
+            cols['Price_Index'] = outputs['Price_Index']
+            cols['Real_GDP'] = outputs['Real_GDP']
+        
+        return cols
+    
+    def _cast_to_float(self, cols):
+        """Cast a dict of column arrays to float arrays through Arrow compute kernels."""
+        cast = {}
+        for col, values in cols.items():
+            values = pa.array(pd.array(values, dtype='string'))
+            values = pc.utf8_trim_whitespace(values)
+            parseable = pc.match_substring_regex(values, _NUMERIC_PATTERN, ignore_case=True)
+            values = pc.cast(pc.if_else(parseable, values, None), pa.float64())
+            cast[col] = _narrow_float(values.to_numpy(zero_copy_only=False))
+        
+        return cast
+    
+    def handle_missing_values(self, cols, method='interpolate'):
+        """Handle missing values in a dict of column arrays."""
         logger.info(f"Handling missing values using method: {method}")
         
-        numeric_columns = df.select_dtypes(include=[np.number]).columns
+        # Integer columns cannot hold NaN, so only float columns need filling
+        float_columns = [col for col, values in cols.items()
+                         if isinstance(values, np.ndarray) and np.issubdtype(values.dtype, np.floating)]
+        
+        # Every method rewrites its columns, so skip them all on clean data
+        if not any(np.isnan(cols[col]).any() for col in float_columns):
+            logger.info("No missing values to handle")
+            return cols
         
         if method == 'interpolate':
             # Linear interpolation for time series data
-            df[numeric_columns] = df[numeric_columns].interpolate(method='linear')
+            self._interpolate_linear(cols, float_columns)
         elif method == 'forward_fill':
-            df[numeric_columns] = df[numeric_columns].fillna(method='ffill')
+            for col in float_columns:
+                cols[col] = _forward_fill(cols[col])
         elif method == 'backward_fill':
-            df[numeric_columns] = df[numeric_columns].fillna(method='bfill')
+            for col in float_columns:
+                cols[col] = _forward_fill(cols[col][::-1])[::-1]
         elif method == 'mean':
-            df[numeric_columns] = df[numeric_columns].fillna(df[numeric_columns].mean())
+            for col in float_columns:
+                values = cols[col].astype(np.float64, copy=False)
+                cols[col] = _restore_dtype(
+                    np.where(np.isnan(values), np.nanmean(values), values), cols[col].dtype)
         elif method == 'median':
-            df[numeric_columns] = df[numeric_columns].fillna(df[numeric_columns].median())
+            for col in float_columns:
+                values = cols[col].astype(np.float64, copy=False)
+                cols[col] = _restore_dtype(
+                    np.where(np.isnan(values), np.nanmedian(values), values), cols[col].dtype)
         else:
             logger.warning(f"Unknown method '{method}'. Using interpolation.")
-            df[numeric_columns] = df[numeric_columns].interpolate(method='linear')
+            self._interpolate_linear(cols, float_columns)
         
-        return df
+        return cols
+    
+    def _interpolate_linear(self, cols, float_columns):
+        """Linearly interpolate NaNs in the given float columns with a compiled kernel."""
+        values = _linear_interp_2d(_stack_columns(cols, float_columns))
+        
+        # Restore any float32 columns the block was widened from
+        for j, col in enumerate(float_columns):
+            cols[col] = _restore_dtype(values[:, j], cols[col].dtype)
     
-    def validate_economic_relationships(self, df):
+    def validate_economic_relationships(self, cols):
         """Validate logical relationships between economic variables."""
         logger.info("Validating economic relationships...")
         
         issues = []
         
-        # Check if GDP components sum correctly (within reasonable tolerance)
-        if all(col in df.columns for col in ['GDP', 'Consumption', 'Investment', 'Government_Spending', 'Net_Exports']):
-            gdp_components_sum = (df['Consumption'] + df['Investment'] + 
-                                df['Government_Spending'] + df['Net_Exports'])
-            gdp_diff = np.abs(df['GDP'] - gdp_components_sum)
-            
-            # Allow for 5% tolerance
-            tolerance = 0.05 * df['GDP'].abs()
-            inconsistent_rows = gdp_diff > tolerance
-            
-            if inconsistent_rows.any():
-                count = inconsistent_rows.sum()
+        # Check if GDP components sum correctly (within 5% tolerance)
+        if all(col in cols for col in ['GDP', 'Consumption', 'Investment', 'Government_Spending', 'Net_Exports']):
+            count = np.count_nonzero(ne.evaluate(
+                "abs(gdp - (c + i + g + nx)) > 0.05 * abs(gdp)",
+                local_dict={'gdp': cols['GDP'], 'c': cols['Consumption'], 'i': cols['Investment'],
+                            'g': cols['Government_Spending'], 'nx': cols['Net_Exports']}))
+            if count > 0:
                 issues.append(f"GDP components don't sum to GDP in {count} rows")
         
-        # Check fiscal deficit calculation
-        if all(col in df.columns for col in ['Fiscal_Deficit', 'Government_Revenue', 'Expenditure']):
-            calculated_deficit = df['Expenditure'] - df['Government_Revenue']
-            deficit_diff = np.abs(df['Fiscal_Deficit'] - calculated_deficit)
-            
-            # Allow for small calculation differences
-            tolerance = 0.01 * df['Expenditure'].abs()
-            inconsistent_deficit = deficit_diff > tolerance
-            
-            if inconsistent_deficit.any():
-                count = inconsistent_deficit.sum()
+        # Check fiscal deficit calculation (allowing for small calculation differences)
+        if all(col in cols for col in ['Fiscal_Deficit', 'Government_Revenue', 'Expenditure']):
+            count = np.count_nonzero(ne.evaluate(
+                "abs(fd - (ex - rev)) > 0.01 * abs(ex)",
+                local_dict={'fd': cols['Fiscal_Deficit'], 'ex': cols['Expenditure'],
+                            'rev': cols['Government_Revenue']}))
+            if count > 0:
                 issues.append(f"Fiscal deficit calculation inconsistent in {count} rows")
         
-        # Check for negative values where they shouldn't occur
+        # Check for negative values where they shouldn't occur, reading each
+        # column in place rather than copying it into a block
         positive_columns = ['GDP', 'Consumption', 'Investment', 'Government_Spending', 
                           'Government_Revenue', 'Expenditure']
-        
         for col in positive_columns:
-            if col in df.columns:
-                negative_values = (df[col] < 0).sum()
-                if negative_values > 0:
-                    issues.append(f"{col} has {negative_values} negative values")
+            if col in cols:
+                count = np.count_nonzero(cols[col] < 0)
+                if count > 0:
+                    issues.append(f"{col} has {count} negative values")
         
         if issues:
             logger.warning("Validation issues found:")
@@ -188,32 +725,297 @@ class EconomicDataPreprocessor:
         else:
             logger.info("All economic relationships validated successfully")
         
-        return df, issues
+        return cols, issues
     
-    def add_derived_variables(self, df):
-        """Add derived economic indicators."""
+    def add_derived_variables(self, cols):
+        """Add derived economic indicators to a dict of column arrays."""
         logger.info("Adding derived variables...")
         
+        # Derived variables are always computed in float64, whatever width
+        # their inputs are stored at
+        f64 = {col: cols[col].astype(np.float64, copy=False) for col in
+               ['GDP', 'Fiscal_Deficit', 'Government_Spending', 'Inflation_Rate'] if col in cols}
+        
         # GDP growth rate (year-over-year)
-        if 'GDP' in df.columns and len(df) > 12:
-            df['GDP_Growth_Rate'] = df['GDP'].pct_change(periods=12) * 100
+        if 'GDP' in cols and len(cols['GDP']) > 12:
+            gdp = f64['GDP']
+            growth_rate = np.full(gdp.shape, np.nan, dtype=np.float64)
+            np.divide(gdp[12:], gdp[:-12], out=growth_rate[12:])
+            growth_rate[12:] -= 1.0
+            growth_rate[12:] *= 100.0
+            cols['GDP_Growth_Rate'] = growth_rate
         
         # Fiscal balance as percentage of GDP
-        if all(col in df.columns for col in ['Fiscal_Deficit', 'GDP']):
-            df['Fiscal_Balance_GDP_Ratio'] = (df['Fiscal_Deficit'] / df['GDP']) * 100
+        if all(col in cols for col in ['Fiscal_Deficit', 'GDP']):
+            cols['Fiscal_Balance_GDP_Ratio'] = ne.evaluate(
+                "fd / gdp * 100.0", local_dict={'fd': f64['Fiscal_Deficit'], 'gdp': f64['GDP']})
         
         # Government spending as percentage of GDP
-        if all(col in df.columns for col in ['Government_Spending', 'GDP']):
-            df['Gov_Spending_GDP_Ratio'] = (df['Government_Spending'] / df['GDP']) * 100
+        if all(col in cols for col in ['Government_Spending', 'GDP']):
+            cols['Gov_Spending_GDP_Ratio'] = ne.evaluate(
+                "gs / gdp * 100.0", local_dict={'gs': f64['Government_Spending'], 'gdp': f64['GDP']})
         
         # Real GDP (inflation-adjusted, using base year approach)
-        if all(col in df.columns for col in ['GDP', 'Inflation_Rate']):
-            # Simple deflation using cumulative inflation from first period
+        if all(col in cols for col in ['GDP', 'Inflation_Rate']):
+            # Simple deflation using cumulative inflation from first period,
+            # computed as exp of a cumulative sum of logs: vectorised and free
+            # of the overflow a long running product can hit
+            base_index = 100.0
+            inflation = f64['Inflation_Rate']
+            
+            # Periods with missing inflation, or inflation at or below -100%
+            # where 1 + r is not positive, are NaN and skipped in the running
+            # sum, as pandas' cumprod skips missing values
+            log_growth = np.full(inflation.shape, np.nan)
+            np.log1p(inflation * 0.01, out=log_growth, where=inflation > -100)
+            cumulative = np.exp(np.nancumsum(log_growth))
+            cumulative[np.isnan(log_growth)] = np.nan
+            
+            cols['Price_Index'] = base_index * cumulative
+            cols['Real_GDP'] = ne.evaluate(
+                "gdp / cumulative", local_dict={'gdp': f64['GDP'], 'cumulative': cumulative})
+        
+        return cols
+    
+    def load_raw_data_pl(self, filename):
+        """
+        Lazily scan a raw CSV file with Polars, parsing the Date and expected
+        numeric columns as part of the scan; nothing is read until collected.
+        """
+        try:
+            filepath = os.path.join(self.raw_data_path, filename)
+            logger.info(f"Scanning data from {filepath}")
+            
+            if not os.path.exists(filepath):
+                logger.error(f"File {filename} not found in {self.raw_data_path}")
+                return None
+            
+            # Date and expected numeric columns are read as text and parsed
+            # here, so an unparseable entry becomes null instead of aborting
+            # the scan
+            header = pl.read_csv(filepath, n_rows=0).columns
+            overrides = {col: pl.String for col in header if col in self.expected_columns}
+            schema = {col: pl.String for col in header}
+            
+            # Any other columns are inferred from the whole file, as pandas
+            # does, so e.g. an integer column holding 1.5 late in the file
+            # is read as float rather than failing. The schema is resolved
+            # once here and pinned, as the scan would otherwise infer it
+            # again on every run of the query
+            other = [col for col in header if col not in overrides]
+            if other:
+                inferred = pl.scan_csv(filepath, schema_overrides=overrides,
+                                       infer_schema_length=None).collect_schema()
+                schema.update((col, inferred[col]) for col in other)
+            ldf = pl.scan_csv(filepath, schema=schema)
+            
+            numeric_columns = [col for col in overrides if col != 'Date']
+            exprs = [pl.col(col).str.strip_chars().cast(pl.Float64, strict=False) for col in numeric_columns]
+            if 'Date' in overrides:
+                # Parse dates the way clean_date_column does, so both
+                # engines read ambiguous dates such as 01/02/2015 alike
+                head = pl.read_csv(filepath, n_rows=100, columns=['Date'], schema_overrides=overrides)
+                date_format = self._strptime_format(head['Date'].to_pandas())
+                exprs.append(pl.col('Date').str.to_datetime(format=date_format, strict=False))
+            
+            # Literal NaN cells become null, like other missing values, so
+            # the fill methods see them
+            return ldf.with_columns(exprs).with_columns(pl.col(numeric_columns).fill_nan(None))
+        
+        except Exception as e:
+            logger.error(f"Error loading {filename}: {str(e)}")
+            return None
+    
+    def _strptime_format(self, dates):
+        """
+        Return the strftime format pandas would parse a Series of date
+        strings with, or None for ISO 8601 dates, which Polars infers.
+        """
+        sample = dates.dropna()
+        if sample.empty or self._detect_date_format(sample) == 'ISO8601':
+            return None
+        return guess_datetime_format(sample.iloc[0])
+    
+    # The _pl stages only extend a lazy query. Statistics they need to log
+    # are returned as reports: a (query, handler) pair whose query is
+    # collected together with the exports, after which the handler logs
+    # the collected result. See _process_dataset_pl.
+    
+    def clean_date_column_pl(self, ldf):
+        """Polars version of clean_date_column; returns the LazyFrame and a report."""
+        logger.info("Cleaning Date column...")
+        
+        if 'Date' not in ldf.collect_schema():
+            logger.warning("Date column not found. Creating dummy dates.")
+            month_offsets = pl.format("{}mo", pl.int_range(pl.len()))
+            ldf = ldf.with_columns(
+                Date=pl.date(2020, 1, 1).dt.offset_by(month_offsets).dt.month_end())
+            return ldf, None
+        
+        def log_invalid_dates(result):
+            invalid_dates = result.item()
+            if invalid_dates > 0:
+                logger.warning(f"Removing {invalid_dates} rows with invalid dates")
+        
+        # Remove rows with invalid dates
+        report = (ldf.select(pl.col('Date').null_count()), log_invalid_dates)
+        return ldf.drop_nulls('Date').sort('Date', maintain_order=True), report
+    
+    def _numeric_columns_pl(self, ldf):
+        """Return the numeric columns of a Polars LazyFrame."""
+        return [col for col, dtype in ldf.collect_schema().items() if dtype.is_numeric()]
+    
+    def clean_numeric_columns_pl(self, ldf):
+        """Polars version of clean_numeric_columns; returns the LazyFrame and a report."""
+        logger.info("Cleaning numeric columns...")
+        
+        expected = [col for col in self.expected_columns.keys() if col != 'Date']
+        schema = ldf.collect_schema()
+        numeric_columns = [col for col in expected if col in schema]
+        for col in expected:
+            if col not in schema:
+                logger.warning(f"Expected column '{col}' not found in data")
+        
+        if not numeric_columns:
+            return ldf, None
+        
+        # load_raw_data_pl already parsed the text columns; cast whatever
+        # else is not a float, replacing invalid values with null
+        ldf = ldf.with_columns(pl.col(col).cast(pl.Float64, strict=False) for col in numeric_columns
+                               if not schema[col].is_float())
+        
+        def log_column_stats(result):
+            stats = result.row(0, named=True)
+            for col in numeric_columns:
+                missing_count = stats[f"{col}__missing"]
+                if missing_count > 0:
+                    logger.info(f"{col}: {missing_count} missing values detected")
+                
+                outlier_count = stats[f"{col}__outliers"] or 0
+                if outlier_count > 0:
+                    logger.warning(f"{col}: {outlier_count} potential outliers detected")
+        
+        # Missing counts and outliers (beyond 3 standard deviations) in one pass
+        query = ldf.select(
+            [pl.col(col).null_count().alias(f"{col}__missing") for col in numeric_columns] +
+            [((pl.col(col) - pl.col(col).mean()).abs() > 3 * pl.col(col).std())
+             .sum().alias(f"{col}__outliers") for col in numeric_columns])
+        return ldf, (query, log_column_stats)
+    
+    def handle_missing_values_pl(self, ldf, method='interpolate'):
+        """Polars version of handle_missing_values operating on a LazyFrame."""
+        logger.info(f"Handling missing values using method: {method}")
+        
+        # Only float columns are filled, as in handle_missing_values
+        numeric_columns = [col for col, dtype in ldf.collect_schema().items() if dtype.is_float()]
+        
+        if method == 'forward_fill':
+            exprs = [pl.col(col).forward_fill() for col in numeric_columns]
+        elif method == 'backward_fill':
+            exprs = [pl.col(col).backward_fill() for col in numeric_columns]
+        elif method == 'mean':
+            exprs = [pl.col(col).fill_null(pl.col(col).mean()) for col in numeric_columns]
+        elif method == 'median':
+            exprs = [pl.col(col).fill_null(pl.col(col).median()) for col in numeric_columns]
+        else:
+            if method != 'interpolate':
+                logger.warning(f"Unknown method '{method}'. Using interpolation.")
+            # Forward fill after interpolating to carry the last value over
+            # trailing gaps, as pandas' linear interpolation does
+            exprs = [pl.col(col).interpolate().forward_fill() for col in numeric_columns]
+        
+        return ldf.with_columns(exprs)
+    
+    def validate_economic_relationships_pl(self, ldf):
+        """
+        Polars version of validate_economic_relationships; returns the
+        LazyFrame and a report whose handler returns the list of issues.
+        """
+        logger.info("Validating economic relationships...")
+        
+        schema = ldf.collect_schema()
+        checks = []
+        
+        # GDP components should sum to GDP within a 5% tolerance
+        if all(col in schema for col in ['GDP', 'Consumption', 'Investment', 'Government_Spending', 'Net_Exports']):
+            gdp_components_sum = (pl.col('Consumption') + pl.col('Investment') +
+                                  pl.col('Government_Spending') + pl.col('Net_Exports'))
+            checks.append(
+                ((pl.col('GDP') - gdp_components_sum).abs() > 0.05 * pl.col('GDP').abs())
+                .sum().alias("GDP components don't sum to GDP in {} rows"))
+        
+        # Fiscal deficit should equal expenditure minus revenue within 1%
+        if all(col in schema for col in ['Fiscal_Deficit', 'Government_Revenue', 'Expenditure']):
+            calculated_deficit = pl.col('Expenditure') - pl.col('Government_Revenue')
+            checks.append(
+                ((pl.col('Fiscal_Deficit') - calculated_deficit).abs() > 0.01 * pl.col('Expenditure').abs())
+                .sum().alias("Fiscal deficit calculation inconsistent in {} rows"))
+        
+        # Check for negative values where they shouldn't occur
+        positive_columns = ['GDP', 'Consumption', 'Investment', 'Government_Spending', 
+                          'Government_Revenue', 'Expenditure']
+        checks.extend((pl.col(col) < 0).sum().alias(f"{col} has {{}} negative values")
+                      for col in positive_columns if col in schema)
+        
+        if not checks:
+            logger.info("All economic relationships validated successfully")
+            return ldf, None
+        
+        def log_issues(result):
+            counts = result.row(0, named=True)
+            issues = [message.format(count) for message, count in counts.items() if count]
+            
+            if issues:
+                logger.warning("Validation issues found:")
+                for issue in issues:
+                    logger.warning(f"  - {issue}")
+            else:
+                logger.info("All economic relationships validated successfully")
+            
+            return issues
+        
+        return ldf, (ldf.select(checks), log_issues)
+    
+    def add_derived_variables_pl(self, ldf):
+        """
+        Polars version of add_derived_variables operating on a LazyFrame.
+        GDP_Growth_Rate is always added, as the row count is only known once
+        the query runs; _process_dataset_pl drops it for 12 rows or fewer.
+        """
+        logger.info("Adding derived variables...")
+        
+        schema = ldf.collect_schema()
+        exprs = []
+        
+        # Derived variables are always computed in float64
+        f64 = {col: pl.col(col).cast(pl.Float64) for col in
+               ['GDP', 'Fiscal_Deficit', 'Government_Spending', 'Inflation_Rate']}
+        
+        # GDP growth rate (year-over-year)
+        if 'GDP' in schema:
+            exprs.append((f64['GDP'].pct_change(12) * 100).alias('GDP_Growth_Rate'))
+        
+        # Fiscal balance as percentage of GDP
+        if all(col in schema for col in ['Fiscal_Deficit', 'GDP']):
+            exprs.append((f64['Fiscal_Deficit'] / f64['GDP'] * 100).alias('Fiscal_Balance_GDP_Ratio'))
+        
+        # Government spending as percentage of GDP
+        if all(col in schema for col in ['Government_Spending', 'GDP']):
+            exprs.append((f64['Government_Spending'] / f64['GDP'] * 100).alias('Gov_Spending_GDP_Ratio'))
+        
+        # Real GDP (inflation-adjusted, using base year approach)
+        if all(col in schema for col in ['GDP', 'Inflation_Rate']):
             base_index = 100
-            df['Price_Index'] = base_index * (1 + df['Inflation_Rate']/100).cumprod()
-            df['Real_GDP'] = df['GDP'] / (df['Price_Index'] / base_index)
+            
+            # Periods with inflation at or below -100% are skipped like
+            # missing ones, as in add_derived_variables
+            inflation = f64['Inflation_Rate'].fill_nan(None)
+            cumulative = (pl.when(inflation > -100).then((inflation * 0.01).log1p())
+                          .cum_sum().exp())
+            exprs.append((base_index * cumulative).alias('Price_Index'))
+            exprs.append((f64['GDP'] / cumulative).alias('Real_GDP'))
         
-        return df
+        return ldf.with_columns(exprs) if exprs else ldf
     
     def generate_summary_statistics(self, df):
         """Generate and log summary statistics."""
@@ -228,19 +1030,136 @@ class EconomicDataPreprocessor:
         
         return summary
     
+    def generate_summary_statistics_pl(self, ldf):
+        """
+        Polars version of generate_summary_statistics; returns a report whose
+        handler returns the summary in the layout of DataFrame.describe.
+        GDP_Growth_Rate is left out for 12 rows or fewer, as the exports drop it.
+        """
+        logger.info("Generating summary statistics...")
+        
+        columns = list(ldf.collect_schema())
+        numeric_columns = self._numeric_columns_pl(ldf)
+        statistics = ['count', 'null_count', 'mean', 'std', 'min', '25%', '50%', '75%', 'max']
+        
+        def describe(col):
+            c = pl.col(col)
+            return [c.count(), c.null_count(), c.mean(), c.std(), c.min(), c.quantile(0.25, 'nearest'),
+                    c.quantile(0.5, 'nearest'), c.quantile(0.75, 'nearest'), c.max()]
+        
+        query = ldf.select(
+            [pl.len().alias('__rows'), pl.col('Date').min().alias('__start'),
+             pl.col('Date').max().alias('__end')] +
+            [expr.cast(pl.Float64).alias(f"{col}__{stat}")
+             for col in numeric_columns for stat, expr in zip(statistics, describe(col))])
+        
+        def log_summary(result):
+            row = result.row(0, named=True)
+            dropped = ['GDP_Growth_Rate'] if row['__rows'] <= 12 else []
+            
+            logger.info(f"Dataset shape: ({row['__rows']}, {len([c for c in columns if c not in dropped])})")
+            logger.info(f"Date range: {row['__start']} to {row['__end']}")
+            logger.info("Summary statistics generated")
+            
+            return pl.DataFrame({'statistic': statistics,
+                                 **{col: [row[f"{col}__{stat}"] for stat in statistics]
+                                    for col in numeric_columns if col not in dropped}})
+        
+        return query, log_summary
+    
     def export_processed_data(self, df, filename):
         """Export cleaned data to processed directory."""
         try:
             filepath = os.path.join(self.processed_data_path, filename)
             df.to_csv(filepath, index=False)
             logger.info(f"Processed data exported to {filepath}")
+            
+            # Parquet copy for downstream consumers
+            parquet_path = os.path.splitext(filepath)[0] + '.parquet'
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pyarrow.parquet.write_table(table, parquet_path, compression='zstd')
+            logger.info(f"Processed data exported to {parquet_path}")
             return True
         except Exception as e:
             logger.error(f"Error exporting data: {str(e)}")
             return False
     
+    def export_processed_data_pl(self, ldf, filename):
+        """
+        Return lazy sinks that write a LazyFrame to CSV and Parquet in the
+        processed directory when passed to pl.collect_all. The CSV has the
+        same layout as export_processed_data's.
+        """
+        filepath = os.path.join(self.processed_data_path, filename)
+        parquet_path = os.path.splitext(filepath)[0] + '.parquet'
+        
+        # df.to_csv writes timestamps that are all midnight as plain dates
+        # and NaN as an empty field
+        date = pl.col('Date')
+        if ldf.collect_schema()['Date'] == pl.Datetime:
+            date = (pl.when((date.dt.truncate('1d') == date).all())
+                    .then(date.dt.strftime('%Y-%m-%d'))
+                    .otherwise(date.dt.strftime('%Y-%m-%d %H:%M:%S')))
+        csv = ldf.with_columns(pl.col(pl.Float64, pl.Float32).fill_nan(None), date.alias('Date'))
+        
+        return [csv.sink_csv(filepath, date_format='%Y-%m-%d', lazy=True),
+                ldf.sink_parquet(parquet_path, compression='zstd', lazy=True)]
+    
+    def _process_dataset_pl(self, input_filename, output_filename, missing_value_method):
+        """
+        Lazy Polars pipeline behind process_dataset(engine='polars'). The
+        stages only build a query; the exports and every statistic the
+        stages log are collected together in one pl.collect_all, which
+        shares a single scan of the CSV between them. Polars still has to
+        hold the columns in memory to sort and interpolate them, but the
+        result is never converted to pandas.
+        """
+        ldf = self.load_raw_data_pl(input_filename)
+        if ldf is None:
+            return None
+        
+        # Data cleaning pipeline
+        ldf, date_report = self.clean_date_column_pl(ldf)
+        ldf, numeric_report = self.clean_numeric_columns_pl(ldf)
+        ldf = self.handle_missing_values_pl(ldf, method=missing_value_method)
+        
+        # Validation and enhancement
+        ldf, validation_report = self.validate_economic_relationships_pl(ldf)
+        ldf = self.add_derived_variables_pl(ldf)
+        
+        # Generate summary and export processed data in one run of the query
+        reports = [report for report in [date_report, numeric_report, validation_report,
+                                         self.generate_summary_statistics_pl(ldf)]
+                   if report is not None]
+        queries = [query for query, _ in reports] + [ldf.select(pl.len())]
+        try:
+            results = pl.collect_all(queries + self.export_processed_data_pl(ldf, output_filename),
+                                     engine='streaming')
+        except Exception as e:
+            logger.error(f"Error processing {input_filename}: {str(e)}")
+            return None
+        
+        for (_, handle), result in zip(reports, results):
+            handle(result)
+        
+        filepath = os.path.join(self.processed_data_path, output_filename)
+        parquet_path = os.path.splitext(filepath)[0] + '.parquet'
+        
+        # Too few rows for a year-over-year rate: rewrite the (at most 12
+        # row) exports without it, as add_derived_variables would skip it
+        n_rows = results[len(reports)].item()
+        if n_rows <= 12 and 'GDP_Growth_Rate' in ldf.collect_schema():
+            processed = pl.read_parquet(parquet_path).drop('GDP_Growth_Rate')
+            pl.collect_all(self.export_processed_data_pl(processed.lazy(), output_filename))
+        
+        logger.info(f"Processed data exported to {filepath}")
+        logger.info(f"Processed data exported to {parquet_path}")
+        logger.info("Data preprocessing completed successfully")
+        
+        return pl.scan_parquet(parquet_path)
+    
     def process_dataset(self, input_filename, output_filename=None, 
-                       missing_value_method='interpolate'):
+                       missing_value_method='interpolate', engine='pandas'):
         """
         Main processing pipeline for economic datasets.
         
@@ -248,9 +1167,12 @@ class EconomicDataPreprocessor:
         - input_filename: Name of the input CSV file in raw data directory
         - output_filename: Name for the output file (optional)
         - missing_value_method: Method for handling missing values
+        - engine: 'pandas', or 'polars' to run the whole pipeline as one
+          lazy Polars query that scans the CSV once
         
         Returns:
-        - Processed DataFrame
+        - Processed DataFrame (for engine='polars', a Polars LazyFrame over
+          the exported Parquet file)
         """
         
         if output_filename is None:
@@ -258,6 +1180,12 @@ class EconomicDataPreprocessor:
         
         logger.info(f"Starting data preprocessing for {input_filename}")
         
+        if engine == 'polars':
+            if pl is None:
+                logger.error("Polars engine requested but polars is not installed")
+                return None
+            return self._process_dataset_pl(input_filename, output_filename, missing_value_method)
+        
         # Load raw data
         df = self.load_raw_data(input_filename)
         if df is None:
@@ -265,12 +1193,23 @@ class EconomicDataPreprocessor:
         
         # Data cleaning pipeline
         df = self.clean_date_column(df)
-        df = self.clean_numeric_columns(df)
-        df = self.handle_missing_values(df, method=missing_value_method)
         
-        # Validation and enhancement
-        df, validation_issues = self.validate_economic_relationships(df)
-        df = self.add_derived_variables(df)
+        # The stages work on plain NumPy column arrays; the DataFrame is
+        # only rebuilt for summary and export
+        cols = _df_to_cols(df)
+        if missing_value_method == 'interpolate':
+            # Cleaning, interpolation and derived variables in one kernel;
+            # validation only reads the columns, so it can run afterwards
+            cols = self.clean_interpolate_and_derive(cols)
+            cols, validation_issues = self.validate_economic_relationships(cols)
+        else:
+            cols = self.clean_numeric_columns(cols)
+            cols = self.handle_missing_values(cols, method=missing_value_method)
+            
+            # Validation and enhancement
+            cols, validation_issues = self.validate_economic_relationships(cols)
+            cols = self.add_derived_variables(cols)
+        df = _cols_to_df(cols)
         
         # Generate summary
         summary = self.generate_summary_statistics(df)
@@ -284,11 +1223,18 @@ class EconomicDataPreprocessor:
         return df
 
 
+def _process_one(dataset):
+    """Process a single dataset in a worker process."""
+    logger.info(f"\n{'='*50}")
+    logger.info(f"Processing {dataset}")
+    logger.info(f"{'='*50}")
+    
+    preprocessor = EconomicDataPreprocessor()
+    return preprocessor.process_dataset(dataset)
+
+
 def main():
     """Main execution function."""
-    # Initialize preprocessor
-    preprocessor = EconomicDataPreprocessor()
-    
     # Example usage - process multiple datasets
     datasets_to_process = [
         'economic_data.csv',
@@ -298,14 +1244,22 @@ def main():
     
     processed_datasets = {}
     
-    for dataset in datasets_to_process:
-        logger.info(f"\n{'='*50}")
-        logger.info(f"Processing {dataset}")
-        logger.info(f"{'='*50}")
+    # Datasets are independent, so process them in parallel
+    max_workers = min(len(datasets_to_process), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_process_one, dataset): dataset
+                   for dataset in datasets_to_process}
         
-        df = preprocessor.process_dataset(dataset)
-        if df is not None:
-            processed_datasets[dataset] = df
+        for future in as_completed(futures):
+            dataset = futures[future]
+            try:
+                df = future.result()
+            except Exception as e:
+                logger.error(f"Error processing {dataset}: {str(e)}")
+                continue
+            
+            if df is not None:
+                processed_datasets[dataset] = df
     
     logger.info(f"\nProcessed {len(processed_datasets)} datasets successfully")
 